@@ -1,15 +1,81 @@
+# /// script
+# dependencies = [
+#   "packaging",
+#   "requests",
+# ]
+# ///
 """
 Analyze all PyTorch 2.x versions and generate comprehensive table. Note the inclusion of 'manylinux_2_28_x86_64' is release name will only find 2.7.0 and newer (currently through 2.8.0).
 """
 
+import functools
+import io
+import json
+import multiprocessing.pool
+import os
 from pathlib import Path
 import subprocess
 import tempfile
-from typing import Any
+import threading
+import time
+from typing import Any, TextIO
 import zipfile
 import re
+import shlex
+import shutil
 
+from packaging.version import InvalidVersion, Version
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Number of PyPI metadata requests issued concurrently
+PYPI_CONCURRENCY = 16
+
+# Number of wheels downloaded concurrently (each is ~850 MB)
+DOWNLOAD_CONCURRENCY = 4
+
+# Number of cuobjdump processes run concurrently on downloaded libraries.
+# Each cuobjdump is single-threaded but reads a large file, so cap it to avoid
+# oversubscribing the disk on many-core machines.
+ANALYSIS_CONCURRENCY = min(os.cpu_count() or 1, 8)
+
+# PyPI JSON responses are cached on disk. Per-version metadata is immutable and
+# never expires; the package index gains new releases so it is refetched hourly.
+PYPI_CACHE_DIR = Path("cache") / "pypi"
+PYPI_INDEX_CACHE_TTL = 3600
+
+# Location of the library inspected by cuobjdump inside a torch wheel
+LIBTORCH_CUDA_MEMBER = "torch/lib/libtorch_cuda.so"
+
+# Command used to invoke cuobjdump from the CUDA Toolkit
+CUOBJDUMP_CMD = "cuobjdump"
+# Example: CUOBJDUMP_CMD = "singularity exec --bind /path/to/bind_dir /path/to/cuda.sif cuobjdump"
+
+# Print the first 20 lines of the full cuobjdump output when no architectures are
+# found in it. Enable by running with CUOBJDUMP_DEBUG=1.
+CUOBJDUMP_DEBUG = os.environ.get("CUOBJDUMP_DEBUG", "") not in ("", "0")
+
+# CUDA architecture tag as printed by cuobjdump (e.g., 'sm_90', 'sm_90a')
+_SM_RE = re.compile(r"sm_\d+[a-z]*")
+
+# Size of each HTTP Range request when reading a remote wheel
+REMOTE_READ_SIZE = 8 << 20
+
+# Chunk size for full wheel downloads and minimum seconds between progress updates
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+PROGRESS_INTERVAL = 0.2
+
+# Shared session so PyPI connections are kept alive and reused across requests
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=50,
+        pool_maxsize=50,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    ),
+)
 
 
 def get_pypi_package_info(
@@ -27,15 +93,66 @@ def get_pypi_package_info(
     """
     if version:
         url = f"https://pypi.org/pypi/{package_name}/{version}/json"
+        cache_path = PYPI_CACHE_DIR / f"{package_name}-{version}.json"
+        ttl = None
     else:
         url = f"https://pypi.org/pypi/{package_name}/json"
+        cache_path = PYPI_CACHE_DIR / f"{package_name}.json"
+        ttl = PYPI_INDEX_CACHE_TTL
 
-    response = requests.get(url)
+    try:
+        if ttl is None or time.time() - cache_path.stat().st_mtime < ttl:
+            with open(cache_path) as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        # Missing, unreadable or corrupt cache entries are simply refetched
+        pass
+
+    response = _SESSION.get(url)
     response.raise_for_status()
-    return response.json()
+    package_info = response.json()
+
+    # Write to a temporary file first so concurrent readers never see partial JSON.
+    # Caching is best-effort: an unwritable cache must not discard the fetched data.
+    tmp_name = None
+    try:
+        PYPI_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=PYPI_CACHE_DIR, suffix=".tmp", delete=False
+        ) as f:
+            tmp_name = f.name
+            json.dump(package_info, f)
+        os.replace(tmp_name, cache_path)
+    except OSError as e:
+        print(f"Warning: could not write PyPI cache {cache_path}: {e}")
+        if tmp_name is not None:
+            Path(tmp_name).unlink(missing_ok=True)
+
+    return package_info
+
+
+@functools.lru_cache(maxsize=64)
+def parse_python_tag(python_tag: str) -> tuple[str, tuple[int, ...]]:
+    """
+    Parse a CPython wheel tag. Cached because the same few tags recur across versions.
+
+    Args:
+        python_tag: Wheel python tag (e.g., 'cp313')
+
+    Returns:
+        Python version string and its parsed tuple for sorting (e.g., ('3.13', (3, 13))),
+        or ('unknown', ()) if it is not a CPython tag
+    """
+    if python_tag.startswith("cp"):
+        version_num = python_tag[2:]  # Remove 'cp' prefix
+        if len(version_num) >= 2 and version_num.isdigit():
+            major = version_num[0]
+            minor = version_num[1:]
+            return f"{major}.{minor}", (int(major), int(minor))
+    return "unknown", ()
 
 
-def extract_python_version_from_filename(filename: str) -> str:
+def extract_python_version_from_filename(filename: str) -> tuple[str, tuple[int, ...]]:
     """
     Extract Python version from wheel filename.
 
@@ -43,19 +160,14 @@ def extract_python_version_from_filename(filename: str) -> str:
         filename: Wheel filename (e.g., 'torch-2.8.0-cp313-cp313-manylinux_2_28_x86_64.whl')
 
     Returns:
-        Python version string (e.g., '3.13')
+        Python version string and its parsed tuple for sorting (e.g., ('3.13', (3, 13))),
+        or ('unknown', ()) if the filename has no CPython tag
     """
     # Wheel filename format: {package}-{version}-{python_tag}-{abi_tag}-{platform_tag}.whl
     parts = filename.split("-")
     if len(parts) >= 3:
-        python_tag = parts[2]  # e.g., 'cp313', 'cp39'
-        if python_tag.startswith("cp"):
-            version_num = python_tag[2:]  # Remove 'cp' prefix
-            if len(version_num) >= 2:
-                major = version_num[0]
-                minor = version_num[1:]
-                return f"{major}.{minor}"
-    return "unknown"
+        return parse_python_tag(parts[2])  # e.g., 'cp313', 'cp39'
+    return "unknown", ()
 
 
 def get_wheel_download_links(package_name: str, version: str) -> list[dict[str, str]]:
@@ -82,19 +194,22 @@ def get_wheel_download_links(package_name: str, version: str) -> list[dict[str,
                 if "manylinux_2_28_x86_64" not in filename:
                     continue
 
-                python_version = extract_python_version_from_filename(filename)
+                python_version, python_version_tuple = (
+                    extract_python_version_from_filename(filename)
+                )
 
                 wheel_info = {
                     "filename": filename,
                     "url": file_info["url"],
                     "size": file_info["size"],
                     "python_version": python_version,
+                    "python_version_tuple": python_version_tuple,
                     "platform_tag": "manylinux_2_28_x86_64",
                 }
                 wheels.append(wheel_info)
 
         # Sort by Python version for consistent ordering
-        wheels.sort(key=lambda x: x["python_version"])
+        wheels.sort(key=lambda x: x["python_version_tuple"])
         return wheels
 
     except requests.exceptions.RequestException as e:
@@ -105,6 +220,26 @@ def get_wheel_download_links(package_name: str, version: str) -> list[dict[str,
         return []
 
 
+def get_all_wheel_download_links(
+    package_name: str, versions: list[str]
+) -> dict[str, list[dict[str, str]]]:
+    """
+    Get wheel file download links for several PyTorch versions concurrently.
+
+    Args:
+        package_name: Name of the package (e.g., 'torch')
+        versions: Version strings (e.g., ['2.8.0', '2.7.1'])
+
+    Returns:
+        Dictionary mapping each version to its list of wheel file information
+    """
+    with multiprocessing.pool.ThreadPool(PYPI_CONCURRENCY) as p:
+        wheel_lists = p.map(
+            functools.partial(get_wheel_download_links, package_name), versions
+        )
+    return dict(zip(versions, wheel_lists))
+
+
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human readable format."""
     if size_bytes >= 1024**3:
@@ -128,7 +263,9 @@ def print_wheel_info(wheels: list[dict[str, str]]) -> None:
         print()
 
 
-def download_wheel(url: str, filename: str, download_dir: Path) -> Path:
+def download_wheel(
+    url: str, filename: str, download_dir: Path, progress: bool = True
+) -> Path:
     """
     Download a wheel file from URL.
 
@@ -136,6 +273,7 @@ def download_wheel(url: str, filename: str, download_dir: Path) -> Path:
         url: URL to download from
         filename: Name of the file
         download_dir: Directory to save the file
+        progress: Whether to print a progress indicator while downloading
 
     Returns:
         Path to the downloaded file
@@ -143,37 +281,155 @@ def download_wheel(url: str, filename: str, download_dir: Path) -> Path:
     download_path = download_dir / filename
 
     print(f"Downloading {filename}...")
-    response = requests.get(url, stream=True)
+    response = _SESSION.get(url, stream=True)
     response.raise_for_status()
 
     total_size = int(response.headers.get("content-length", 0))
-    downloaded = 0
 
     with open(download_path, "wb") as f:
-        for chunk in response.iter_content(chunk_size=8192):
-            f.write(chunk)
-            downloaded += len(chunk)
-            if total_size > 0:
-                percent = (downloaded / total_size) * 100
-                print(f"\rProgress: {percent:.1f}%", end="", flush=True)
-
-    print(f"\nDownloaded to {download_path}")
+        if not progress or total_size == 0:
+            # Let shutil copy straight from the socket without per-chunk bookkeeping
+            response.raw.decode_content = True
+            shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+        else:
+            downloaded = 0
+            last_print = 0.0
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+                downloaded += len(chunk)
+                now = time.monotonic()
+                if now - last_print >= PROGRESS_INTERVAL:
+                    last_print = now
+                    percent = (downloaded / total_size) * 100
+                    print(f"\rProgress: {percent:.1f}%", end="", flush=True)
+            print(f"\rProgress: {(downloaded / total_size) * 100:.1f}%")
+
+    print(f"Downloaded to {download_path}")
     return download_path
 
 
-def extract_wheel(wheel_path: Path, extract_dir: Path) -> Path:
+def extract_wheel(wheel_path: Path, extract_dir: Path, full: bool = False) -> Path:
     """
-    Extract wheel file as a zip archive.
+    Extract libtorch_cuda.so (or the whole archive) from a wheel file.
 
     Args:
         wheel_path: Path to the wheel file
         extract_dir: Directory to extract to
+        full: Extract every file instead of only libtorch_cuda.so
 
     Returns:
         Path to the extraction directory
     """
     with zipfile.ZipFile(wheel_path, "r") as zip_ref:
-        zip_ref.extractall(extract_dir)
+        if full:
+            zip_ref.extractall(extract_dir)
+        elif LIBTORCH_CUDA_MEMBER in zip_ref.namelist():
+            zip_ref.extract(LIBTORCH_CUDA_MEMBER, extract_dir)
+
+    print(f"Extracted to {extract_dir}")
+    return extract_dir
+
+
+class HTTPRangeFile(io.RawIOBase):
+    """
+    Read-only, seekable file backed by HTTP Range requests.
+
+    Lets zipfile read the central directory and a single member of a remote
+    wheel without downloading the rest of the archive.
+    """
+
+    def __init__(self, url: str, size: int):
+        self.url = url
+        self.size = size
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+
+        if pos < 0:
+            raise ValueError(f"Negative seek position: {pos}")
+        self._pos = pos
+        return pos
+
+    def readinto(self, b) -> int:
+        if self._pos >= self.size or len(b) == 0:
+            return 0
+
+        end = min(self._pos + len(b), self.size) - 1
+        # Stream so the status can be checked before any of the body is read; a
+        # server that ignores Range would otherwise send the whole wheel
+        with _SESSION.get(
+            self.url, headers={"Range": f"bytes={self._pos}-{end}"}, stream=True
+        ) as response:
+            response.raise_for_status()
+            content_range = response.headers.get("content-range", "")
+            if response.status_code != 206 or not content_range.startswith(
+                f"bytes {self._pos}-"
+            ):
+                raise OSError(f"Server ignored Range request for {self.url}")
+
+            data = response.content
+        b[: len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+
+def fetch_libtorch_cuda(
+    wheel: dict[str, str], download_dir: Path, progress: bool = True
+) -> Path:
+    """
+    Fetch libtorch_cuda.so from a remote wheel without downloading the whole wheel.
+    Only the zip central directory and the compressed library are read, using
+    HTTP Range requests. Falls back to downloading and extracting the full wheel
+    if the server does not support ranges.
+
+    Args:
+        wheel: Wheel information
+        download_dir: Directory to save the files
+        progress: Whether to print download progress for the fallback download
+
+    Returns:
+        Path to the extraction directory
+    """
+    extract_dir = download_dir / "extracted"
+
+    response = _SESSION.head(wheel["url"], allow_redirects=True)
+    response.raise_for_status()
+    size = int(response.headers.get("content-length", 0))
+
+    if response.headers.get("accept-ranges", "").lower() != "bytes" or size == 0:
+        print(f"Range requests not supported for {wheel['filename']}")
+        wheel_path = download_wheel(
+            wheel["url"], wheel["filename"], download_dir, progress=progress
+        )
+        extract_wheel(wheel_path, extract_dir)
+        # The wheel itself is no longer needed once the library is extracted
+        wheel_path.unlink()
+        return extract_dir
+
+    print(f"Fetching {LIBTORCH_CUDA_MEMBER} from {wheel['filename']}...")
+    remote = io.BufferedReader(
+        HTTPRangeFile(response.url, size), buffer_size=REMOTE_READ_SIZE
+    )
+    with remote, zipfile.ZipFile(remote) as zip_ref:
+        if LIBTORCH_CUDA_MEMBER in zip_ref.namelist():
+            zip_ref.extract(LIBTORCH_CUDA_MEMBER, extract_dir)
 
     print(f"Extracted to {extract_dir}")
     return extract_dir
@@ -196,66 +452,103 @@ def get_cuda_architectures(extract_dir: Path) -> list[str]:
         return []
 
     try:
-        cuobjdump_cmd = "cuobjdump"
-        # Example: cuobjdump_cmd = "singularity exec --bind /path/to/bind_dir /path/to/cuda.sif cuobjdump"
-        command_raw = f"{cuobjdump_cmd} '{libtorch_path}'"
-
-        print(f"Running: {command_raw}")
-        result_raw = subprocess.run(
-            command_raw,
-            shell=True,
-            capture_output=True,
-            text=True,
-            check=True,
-            executable="/bin/bash",
+        # Only list the embedded ELF and PTX files, whose names carry the sm_XX tag,
+        # instead of dumping their full contents
+        command = [*shlex.split(CUOBJDUMP_CMD), "-lelf", "-lptx", str(libtorch_path)]
+
+        print(f"Running: {shlex.join(command)}")
+        result = subprocess.run(command, capture_output=True, text=True, check=True)
+
+        unique_archs = sorted(set(_SM_RE.findall(result.stdout)))
+        if unique_archs:
+            print(f"{libtorch_path}: {', '.join(unique_archs)}")
+            return unique_archs
+
+        print(
+            f"{libtorch_path}: no architectures listed. "
+            "Falling back to full cuobjdump output..."
+        )
+
+    except subprocess.CalledProcessError as e:
+        print(
+            f"{libtorch_path}: error listing cuobjdump files: {e} "
+            f"(stderr: {e.stderr.strip()}). Falling back to full cuobjdump output..."
         )
+    except Exception as e:
+        print(f"{libtorch_path}: unexpected error: {e}")
+        return []
+
+    return get_cuda_architectures_from_dump(libtorch_path)
 
-        print(f"cuobjdump output length: {len(result_raw.stdout)} characters")
 
-        # Let's look for lines containing 'arch' (case insensitive)
-        arch_lines = []
-        for line in result_raw.stdout.split("\n"):
-            if "arch" in line.lower():
-                arch_lines.append(line.strip())
+def get_cuda_architectures_from_dump(libtorch_path: Path) -> list[str]:
+    """
+    Run cuobjdump without flags on a library and scan its full output for architectures.
+
+    Args:
+        libtorch_path: Path to libtorch_cuda.so
+
+    Returns:
+        List of supported CUDA architectures
+    """
+    try:
+        command_raw = [*shlex.split(CUOBJDUMP_CMD), str(libtorch_path)]
+
+        print(f"Running: {shlex.join(command_raw)}")
+
+        # Stream the output line by line instead of buffering the whole dump.
+        # stderr goes to a file so a chatty stderr cannot block the stdout pipe.
+        found_archs = set()
+        first_lines = []
+        output_length = 0
+        with (
+            tempfile.TemporaryFile("w+") as stderr,
+            subprocess.Popen(
+                command_raw,
+                stdout=subprocess.PIPE,
+                stderr=stderr,
+                text=True,
+                bufsize=1,
+            ) as process,
+        ):
+            for line in process.stdout:
+                output_length += len(line)
+                if CUOBJDUMP_DEBUG and len(first_lines) < 20:
+                    first_lines.append(line.rstrip("\n"))
+                found_archs.update(_SM_RE.findall(line))
+
+            if process.wait() != 0:
+                stderr.seek(0)
+                raise subprocess.CalledProcessError(
+                    process.returncode, command_raw, stderr=stderr.read()
+                )
 
-        if arch_lines:
-            # Sort and remove duplicates
-            unique_archs = sorted(set(arch_lines))
-            print("Found architectures:")
-            for arch in unique_archs:
-                print(f"  {arch}")
+        print(f"{libtorch_path}: cuobjdump output length: {output_length} characters")
+
+        unique_archs = sorted(found_archs)
+        if unique_archs:
+            print(f"{libtorch_path}: {', '.join(unique_archs)}")
             return unique_archs
+
+        if CUOBJDUMP_DEBUG:
+            # A single print keeps the block together when analyses run concurrently
+            print(
+                f"{libtorch_path}: no architecture patterns found. "
+                "First 20 lines of cuobjdump output:\n"
+                + "\n".join(f"  {i + 1}: {line}" for i, line in enumerate(first_lines))
+            )
         else:
-            # Let's see if there are any lines that might contain architecture info
-            print("No lines with 'arch' found. Looking for other patterns...")
-
-            # Look for sm_ patterns
-            sm_lines = []
-            for line in result_raw.stdout.split("\n"):
-                if "sm_" in line.lower():
-                    sm_lines.append(line.strip())
-
-            if sm_lines:
-                print("Found lines with 'sm_' pattern:")
-                for line in sm_lines[:10]:  # Show first 10 matches
-                    print(f"  {line}")
-                return sm_lines
-            else:
-                print(
-                    "No architecture patterns found. Showing first 20 lines of cuobjdump output:"
-                )
-                lines = result_raw.stdout.split("\n")
-                for i, line in enumerate(lines[:20]):
-                    print(f"  {i + 1}: {line}")
-                return []
+            print(f"{libtorch_path}: no architecture patterns found.")
+        return []
 
     except subprocess.CalledProcessError as e:
-        print(f"Error running cuobjdump command: {e}")
-        print(f"stdout: {e.stdout}")
-        print(f"stderr: {e.stderr}")
+        print(
+            f"{libtorch_path}: error running cuobjdump command: {e} "
+            f"(stderr: {e.stderr.strip()})"
+        )
         return []
     except Exception as e:
-        print(f"Unexpected error: {e}")
+        print(f"{libtorch_path}: unexpected error: {e}")
         return []
 
 
@@ -279,15 +572,8 @@ def analyze_first_wheel(wheels: list[dict[str, str]]) -> dict[str, Any] | None:
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_path = Path(temp_dir)
 
-        # Download the wheel
-        wheel_path = download_wheel(
-            first_wheel["url"], first_wheel["filename"], temp_path
-        )
-
-        # Extract the wheel
-        extract_dir = temp_path / "extracted"
-        extract_dir.mkdir()
-        extract_wheel(wheel_path, extract_dir)
+        # Fetch libtorch_cuda.so from the wheel
+        extract_dir = fetch_libtorch_cuda(first_wheel, temp_path)
 
         # Get CUDA architectures
         archs = get_cuda_architectures(extract_dir)
@@ -295,76 +581,118 @@ def analyze_first_wheel(wheels: list[dict[str, str]]) -> dict[str, Any] | None:
         return {"wheel_info": first_wheel, "cuda_architectures": archs}
 
 
-def analyze_all_wheels(
-    wheels: list[dict[str, str]], package_version: str
-) -> list[dict[str, Any]]:
+def analyze_extracted_wheel(
+    wheel: dict[str, str], package_version: str, extract_dir: Path
+) -> dict[str, Any]:
     """
-    Download and analyze all wheel files to extract CUDA architectures.
+    Analyze an extracted wheel to extract CUDA architectures.
 
     Args:
-        wheels: List of wheel information
+        wheel: Wheel information
         package_version: Version string (e.g., '2.8.0')
+        extract_dir: Directory where the wheel was extracted
 
     Returns:
-        List of dictionaries with wheel info and supported architectures
+        Dictionary with wheel info and supported architectures
     """
-    results = []
+    # Get CUDA architectures (already sorted, deduplicated sm_XX tags)
+    archs = get_cuda_architectures(extract_dir)
 
-    for i, wheel in enumerate(wheels, 1):
-        print(f"\n{'=' * 60}")
-        print(f"Analyzing wheel {i}/{len(wheels)}: {wheel['filename']}")
-        print(f"{'=' * 60}")
+    if archs:
+        arch_summary = f"Architectures: {', '.join(archs)}"
+    else:
+        arch_summary = "No CUDA architectures found"
+    print(f"✓ Successfully analyzed {wheel['filename']}\n  {arch_summary}")
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+    return {
+        "wheel_info": wheel,
+        "cuda_architectures": archs,
+        "package_version": package_version,
+    }
 
-            try:
-                # Download the wheel
-                wheel_path = download_wheel(wheel["url"], wheel["filename"], temp_path)
-
-                # Extract the wheel
-                extract_dir = temp_path / "extracted"
-                extract_dir.mkdir()
-                extract_wheel(wheel_path, extract_dir)
-
-                # Get CUDA architectures
-                archs = get_cuda_architectures(extract_dir)
-
-                # Clean up arch strings to just extract sm_XX values
-                clean_archs = []
-                for arch in archs:
-                    if "sm_" in arch:
-                        # Extract just the sm_XX part
-
-                        match = re.search(r"sm_\d+[a-z]*", arch)
-                        if match:
-                            clean_archs.append(match.group())
-
-                results.append(
-                    {
-                        "wheel_info": wheel,
-                        "cuda_architectures": sorted(set(clean_archs)),
-                        "package_version": package_version,
-                    }
-                )
 
-                print(f"✓ Successfully analyzed {wheel['filename']}")
-                if clean_archs:
-                    print(f"  Architectures: {', '.join(sorted(set(clean_archs)))}")
-                else:
-                    print("  No CUDA architectures found")
+def analyze_all_wheels(
+    version_wheels: dict[str, list[dict[str, str]]],
+) -> list[dict[str, Any]]:
+    """
+    Download and analyze all wheel files to extract CUDA architectures.
+    Wheels of every version share one pipeline, so there is no stall at version
+    boundaries. Downloads and cuobjdump runs are pipelined: up to
+    DOWNLOAD_CONCURRENCY wheels are fetched while up to ANALYSIS_CONCURRENCY
+    fetched wheels are analyzed.
+    At most DOWNLOAD_CONCURRENCY + ANALYSIS_CONCURRENCY temporary directories
+    exist at any time, so fetching waits when analysis falls behind.
+
+    Args:
+        version_wheels: Dictionary mapping version strings (e.g., '2.8.0') to
+            their lists of wheel information
 
+    Returns:
+        List of dictionaries with wheel info and supported architectures,
+        in the order of version_wheels
+    """
+    jobs = [
+        (package_version, wheel)
+        for package_version, wheels in version_wheels.items()
+        for wheel in wheels
+    ]
+
+    print(f"\n{'=' * 60}")
+    print(f"Analyzing {len(jobs)} wheels for {len(version_wheels)} versions")
+    print(f"{'=' * 60}")
+
+    # Interleaved progress lines from concurrent downloads would be unreadable
+    progress = min(DOWNLOAD_CONCURRENCY, len(jobs)) <= 1
+
+    fetch_pool = multiprocessing.pool.ThreadPool(DOWNLOAD_CONCURRENCY)
+    analysis_pool = multiprocessing.pool.ThreadPool(ANALYSIS_CONCURRENCY)
+
+    # Each extracted libtorch_cuda.so is ~1 GB, so bound how many wait on disk
+    temp_dir_slots = threading.BoundedSemaphore(
+        DOWNLOAD_CONCURRENCY + ANALYSIS_CONCURRENCY
+    )
+
+    def analyze(package_version, wheel, temp_dir):
+        try:
+            extract_dir = Path(temp_dir.name) / "extracted"
+            return analyze_extracted_wheel(wheel, package_version, extract_dir)
+        finally:
+            temp_dir.cleanup()
+            temp_dir_slots.release()
+
+    def fetch(package_version, wheel):
+        # Hand the fetched wheel straight to the analysis pool so this worker
+        # can start on the next download
+        temp_dir_slots.acquire()
+        temp_dir = tempfile.TemporaryDirectory()
+        try:
+            fetch_libtorch_cuda(wheel, Path(temp_dir.name), progress=progress)
+            return analysis_pool.apply_async(
+                analyze, (package_version, wheel, temp_dir)
+            )
+        except Exception:
+            temp_dir.cleanup()
+            temp_dir_slots.release()
+            raise
+
+    results = {}
+    try:
+        fetches = [fetch_pool.apply_async(fetch, job) for job in jobs]
+        for (package_version, wheel), fetched in zip(jobs, fetches):
+            try:
+                results[wheel["filename"]] = fetched.get().get()
             except Exception as e:
                 print(f"✗ Error analyzing {wheel['filename']}: {e}")
-                results.append(
-                    {
-                        "wheel_info": wheel,
-                        "cuda_architectures": [],
-                        "package_version": package_version,
-                    }
-                )
+                results[wheel["filename"]] = {
+                    "wheel_info": wheel,
+                    "cuda_architectures": [],
+                    "package_version": package_version,
+                }
+    finally:
+        fetch_pool.terminate()
+        analysis_pool.terminate()
 
-    return results
+    return [results[wheel["filename"]] for _, wheel in jobs]
 
 
 def generate_pip_table(
@@ -420,17 +748,17 @@ def get_all_pytorch_2x_versions(package_name: str = "torch") -> list[str]:
         # Filter for 2.x versions and sort them
         pytorch_2x_versions = []
         for version in all_versions:
-            if version.startswith("2."):
-                # Skip pre-release versions (rc, dev, etc.)
-                if not any(marker in version for marker in ["rc", "dev", "a", "b"]):
-                    pytorch_2x_versions.append(version)
+            try:
+                parsed_version = Version(version)
+            except InvalidVersion:
+                continue
 
-        # Sort versions using semantic versioning
-        def version_key(v):
-            parts = v.split(".")
-            return [int(x) for x in parts]
+            # Skip pre-release versions (rc, dev, etc.)
+            if parsed_version.major == 2 and not parsed_version.is_prerelease:
+                pytorch_2x_versions.append(version)
 
-        pytorch_2x_versions.sort(key=version_key, reverse=True)  # Latest first
+        # Sort versions following PEP 440
+        pytorch_2x_versions.sort(key=Version, reverse=True)  # Latest first
         return pytorch_2x_versions
 
     except Exception as e:
@@ -438,49 +766,42 @@ def get_all_pytorch_2x_versions(package_name: str = "torch") -> list[str]:
         return []
 
 
-def save_table_to_file(table_content: str, filename: str = "table_pip.md") -> None:
+def save_table_to_file(
+    all_results: list[dict[str, Any]], filename: str = "table_pip.md"
+) -> None:
     """
-    Save the markdown table to a file.
+    Save the comprehensive markdown table to a file.
 
     Args:
-        table_content: The markdown table content
+        all_results: List of all analysis results across versions
         filename: Output filename
     """
     with open(filename, "w") as f:
-        f.write(table_content)
+        generate_comprehensive_pip_table(all_results, f)
     print(f"Table saved to {filename}")
 
 
-def generate_comprehensive_pip_table(all_results: list[dict[str, Any]]) -> str:
+def generate_comprehensive_pip_table(
+    all_results: list[dict[str, Any]], out: TextIO
+) -> None:
     """
-    Generate a comprehensive markdown table for all versions and wheels.
+    Write a comprehensive markdown table for all versions and wheels.
     Sorted with newest versions first, then by Python version.
+    Rows are written one at a time rather than joined into a single string.
 
     Args:
         all_results: List of all analysis results across versions
-
-    Returns:
-        Markdown table string
+        out: Text stream to write the markdown table to
     """
-    lines = []
-    lines.append("| package | architectures |")
-    lines.append("|---------|---------------|")
-
-    # Sort results: newest version first, then by python version
-    def sort_key(result):
-        version = result["package_version"]
-        python_version = result["wheel_info"]["python_version"]
-
-        # Parse version for proper sorting (e.g., "2.8.0" -> [2, 8, 0])
-        version_parts = [int(x) for x in version.split(".")]
+    out.write("| package | architectures |\n")
+    out.write("|---------|---------------|")
 
-        # Parse python version (e.g., "3.10" -> [3, 10])
-        python_parts = [int(x) for x in python_version.split(".")]
-
-        # Return tuple: (negative version for desc order, python version for asc order)
-        return ([-x for x in version_parts], python_parts)
-
-    sorted_results = sorted(all_results, key=sort_key)
+    # Sort results: newest version first, then by python version.
+    # Sorting is stable, so sort by python version and then by package version
+    sorted_results = sorted(
+        all_results, key=lambda r: r["wheel_info"]["python_version_tuple"]
+    )
+    sorted_results.sort(key=lambda r: Version(r["package_version"]), reverse=True)
 
     for result in sorted_results:
         wheel_info = result["wheel_info"]
@@ -495,9 +816,7 @@ def generate_comprehensive_pip_table(all_results: list[dict[str, Any]]) -> str:
         else:
             arch_str = ""
 
-        lines.append(f"| {package_name} | {arch_str} |")
-
-    return "\n".join(lines)
+        out.write(f"\n| {package_name} | {arch_str} |")
 
 
 def main():
@@ -520,11 +839,11 @@ def main():
     # Count total wheels before processing
     print("Counting total wheels to be processed...")
     total_wheels_estimate = 0
+    version_wheels = get_all_wheel_download_links(package, versions)
     version_wheel_counts = {}
 
     for version in versions:
-        wheels = get_wheel_download_links(package, version)
-        wheel_count = len(wheels)
+        wheel_count = len(version_wheels[version])
         version_wheel_counts[version] = wheel_count
         total_wheels_estimate += wheel_count
         print(f"  {version}: {wheel_count} wheels")
@@ -551,31 +870,26 @@ def main():
         print("\nAborted.")
         return
 
-    all_results = []
-    total_wheels = 0
-
-    # Process each version
-    for version_idx, version in enumerate(versions, 1):
-        wheel_count = version_wheel_counts[version]
-
-        if wheel_count == 0:
+    for version in versions:
+        if version_wheel_counts[version] == 0:
             print(f"Skipping {version} (no manylinux_2_28_x86_64 wheels)")
-            continue
 
-        print(f"\n{'=' * 80}")
-        print(
-            f"Processing version {version_idx}/{len(versions)}: {package} {version} ({wheel_count} wheels)"
-        )
-        print(f"{'=' * 80}")
-
-        wheels = get_wheel_download_links(package, version)
-        total_wheels += len(wheels)
-
-        # Analyze all wheels for this version
-        version_results = analyze_all_wheels(wheels, version)
-        all_results.extend(version_results)
+    # Analyze the wheels of all versions in a single pipeline
+    all_results = analyze_all_wheels(
+        {
+            version: version_wheels[version]
+            for version in versions
+            if version_wheels[version]
+        }
+    )
+    total_wheels = len(all_results)
+
+    # Print summary for each version
+    for version in versions:
+        version_results = [r for r in all_results if r["package_version"] == version]
+        if not version_results:
+            continue
 
-        # Print summary for this version
         print(f"\nSummary for {version}:")
         for result in version_results:
             wheel_info = result["wheel_info"]
@@ -593,8 +907,7 @@ def main():
         print(f"Total wheels processed: {total_wheels}")
         print(f"{'=' * 80}")
 
-        table_content = generate_comprehensive_pip_table(all_results)
-        save_table_to_file(table_content)
+        save_table_to_file(all_results)
 
         # Final summary
         version_counts = {}
@@ -607,7 +920,9 @@ def main():
         print("\nFinal Summary:")
         print(f"Total PyTorch versions processed: {len(version_counts)}")
         print(f"Total wheel files analyzed: {len(all_results)}")
-        for version, count in sorted(version_counts.items(), reverse=True):
+        for version, count in sorted(
+            version_counts.items(), key=lambda item: Version(item[0]), reverse=True
+        ):
             print(f"  {version}: {count} wheels")
 
     else: